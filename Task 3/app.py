@@ -1,25 +1,95 @@
+import time
+_import_start = time.perf_counter()
+
+import os
+import logging
+import threading
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, Form
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-import joblib
-import numpy as np
 import uvicorn
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="joblib")
 
-# Initialize FastAPI app and templates
-app = FastAPI()
-templates = Jinja2Templates(directory="templates")
+# Startup-optimized mode: defer Jinja2, NumPy, joblib and scikit-learn to a background warm-up
+# so the port opens immediately, and cache the rendered home page
+FAST_STARTUP = os.getenv("FAST_STARTUP", "0") == "1"
+
+logger = logging.getLogger("uvicorn.error")
 
-try:
-    model = joblib.load("model.joblib")
-except Exception as e:
-    raise HTTPException(status_code=500, detail=f"Error loading model: {e}")
+# Templates, model and NumPy are bound by the warm-up, ready is set once it has finished
+templates = None
+model = None
+np = None
+warm_up_error = None
+index_html = None
+ready_event = threading.Event()
+
+# Cold-start timings in seconds, reported through /ready and the server log
+timings = {"import_time": None, "warm_up_time": None, "warm_up_prediction_time": None, "startup_time": None}
 
 # Iris species labels
 iris_species = {0: "Setosa", 1: "Versicolor", 2: "Virginica"}
 
+def get_templates():
+    global templates
+    if templates is None:
+        from fastapi.templating import Jinja2Templates
+        templates = Jinja2Templates(directory="templates")
+    return templates
+
+def load_model():
+    import joblib
+    try:
+        return joblib.load("model.joblib")
+    except Exception as e:
+        raise RuntimeError(f"Error loading model: {e}")
+
+def run_prediction(features):
+    prediction = model.predict(np.array([features]))
+    return iris_species.get(prediction[0], "Unknown")
+
+# Load templates and model, then run one prediction so the first request pays no warm-up cost
+def warm_up():
+    global model, np
+    warm_up_start = time.perf_counter()
+    import numpy as np
+    get_templates()
+    model = load_model()
+    prediction_start = time.perf_counter()
+    run_prediction([5.1, 3.5, 1.4, 0.2])
+    now = time.perf_counter()
+    timings["warm_up_prediction_time"] = now - prediction_start
+    timings["warm_up_time"] = now - warm_up_start
+    timings["startup_time"] = now - _import_start
+    ready_event.set()
+    logger.info(
+        "Model ready: warm-up %.3fs, startup %.3fs (fast startup: %s)",
+        timings["warm_up_time"], timings["startup_time"], FAST_STARTUP,
+    )
+
+# A failed warm-up is stored and reported by /ready and /live so the orchestrator restarts the container
+def warm_up_in_background():
+    global warm_up_error
+    try:
+        warm_up()
+    except Exception as e:
+        warm_up_error = str(e)
+        logger.exception("Warm-up failed")
+
+# Default mode warms up before serving, fast startup mode warms up while /ready reports 503
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if FAST_STARTUP:
+        threading.Thread(target=warm_up_in_background, daemon=True).start()
+    else:
+        warm_up()
+    yield
+
+# Initialize FastAPI app
+app = FastAPI(lifespan=lifespan)
+
 # Define the structure of the input data for the API
 class ModelInput(BaseModel):
     feature1: float
@@ -27,21 +97,40 @@ class ModelInput(BaseModel):
     feature3: float
     feature4: float
 
+# Liveness probe, fails once the warm-up has failed
+@app.get("/live")
+def live():
+    if warm_up_error is not None:
+        raise HTTPException(status_code=500, detail=f"Warm-up failed: {warm_up_error}")
+    return {"status": "alive"}
+
+# Readiness probe, also reports cold-start timings for this release
+@app.get("/ready")
+def ready():
+    if warm_up_error is not None:
+        raise HTTPException(status_code=503, detail=f"Warm-up failed: {warm_up_error}")
+    if not ready_event.is_set():
+        raise HTTPException(status_code=503, detail="Warming up")
+    return {"status": "ready", "fast_startup": FAST_STARTUP, **timings}
+
 # Home page with HTML form
 @app.get("/", response_class=HTMLResponse)
 def read_root(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    global index_html
+    if not FAST_STARTUP:
+        return get_templates().TemplateResponse("index.html", {"request": request})
+    if index_html is None:
+        index_html = get_templates().get_template("index.html").render({"request": request})
+    return HTMLResponse(content=index_html)
 
 # Prediction API endpoint
 @app.post("/predict")
 def predict_api(input: ModelInput):
-    if model is None:
-        raise HTTPException(status_code=500, detail="Model not loaded")
+    if not ready_event.is_set():
+        raise HTTPException(status_code=503, detail="Model not loaded")
+
+    species = run_prediction([input.feature1, input.feature2, input.feature3, input.feature4])
 
-    features = np.array([[input.feature1, input.feature2, input.feature3, input.feature4]])
-    prediction = model.predict(features)
-    species = iris_species.get(prediction[0], "Unknown")
-    
     return {"prediction": species}
 
 # Form submission endpoint
@@ -53,15 +142,16 @@ def predict_form(
     feature3: float = Form(...),
     feature4: float = Form(...)
 ):
-    if model is None:
-        return templates.TemplateResponse("index.html", {"request": request, "error": "Model not loaded"})
+    if not ready_event.is_set():
+        return get_templates().TemplateResponse("index.html", {"request": request, "error": "Model not loaded"})
+
+    species = run_prediction([feature1, feature2, feature3, feature4])
+
+    return get_templates().TemplateResponse("index.html", {"request": request, "prediction": species})
 
-    features = np.array([[feature1, feature2, feature3, feature4]])
-    prediction = model.predict(features)
-    species = iris_species.get(prediction[0], "Unknown")
-    
-    return templates.TemplateResponse("index.html", {"request": request, "prediction": species})
+timings["import_time"] = time.perf_counter() - _import_start
+logger.info("Import time: %.3fs (fast startup: %s)", timings["import_time"], FAST_STARTUP)
 
 # Run the FastAPI app
 if __name__ == "__main__":
-    uvicorn.run("app:app", host='0.0.0.0', port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("app:app", host='0.0.0.0', port=8000, reload=True)